@@ -1,6 +1,7 @@
 """Iterator classes for working with paginated API responses."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, List, Optional
 
 from pydantic import validator
@@ -112,17 +113,27 @@ class EndpointIterator:
     Objects returned by the iterator may also be converted to a specific type.  This
     is most commonly used to wrap API objects with a higher-level object (such as ORM
     types).
+
+    If `prefetch` is enabled, the next page of results is requested in the background
+    once the caller moves past the first item of the current page, so that the API
+    round trip overlaps with processing of the current page.
     """
 
-    def __init__(self, endpoint, datatype=None):
+    def __init__(self, endpoint, datatype=None, prefetch=False):
         """Initialize an object list iterator for the specified endpoint.
 
         If a class is provided, it will be constructued for each result returned by
         this iterator.  The constructor must accept a single argument, which is the
         `NotionObject` contained in the `ObjectList`.
+
+        If `prefetch` is `True`, the endpoint will be called from a background thread
+        while the caller is working through the current page.  Only enable this when
+        the caller does not use the same session (or modify the queried objects) during
+        iteration.
         """
         self._endpoint = endpoint
         self._datatype = datatype
+        self._prefetch = prefetch
 
         self.has_more = None
         self.page_num = -1
@@ -141,23 +152,46 @@ class EndpointIterator:
 
         self.next_cursor = kwargs.pop("start_cursor", None)
 
-        while self.has_more:
-            self.page_num += 1
+        executor = ThreadPoolExecutor(max_workers=1) if self._prefetch else None
+        pending = None
 
-            page = self._endpoint(start_cursor=self.next_cursor, **kwargs)
+        try:
+            while self.has_more:
+                self.page_num += 1
 
-            api_list = ObjectList.parse_obj(page)
+                if pending is None:
+                    page = self._endpoint(start_cursor=self.next_cursor, **kwargs)
+                else:
+                    page = pending.result()
+                    pending = None
 
-            for obj in api_list.results:
-                self.total_items += 1
+                api_list = ObjectList.parse_obj(page)
 
-                if self._datatype is None:
-                    yield obj
-                else:
-                    yield self._datatype(obj)
+                next_cursor = api_list.next_cursor
+                has_more = api_list.has_more and next_cursor is not None
+
+                for idx, obj in enumerate(api_list.results):
+                    # waiting for the second item avoids an extra request when the
+                    # caller only wants the first result (e.g. `QueryBuilder.first()`)
+                    if idx == 1 and executor is not None and has_more:
+                        logger.debug("prefetching next page :: %s", next_cursor)
+                        pending = executor.submit(
+                            self._endpoint, start_cursor=next_cursor, **kwargs
+                        )
+
+                    self.total_items += 1
+
+                    if self._datatype is None:
+                        yield obj
+                    else:
+                        yield self._datatype(obj)
+
+                self.next_cursor = next_cursor
+                self.has_more = has_more
 
-            self.next_cursor = api_list.next_cursor
-            self.has_more = api_list.has_more and self.next_cursor is not None
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
 
     def list(self, **kwargs):
         """Collect all items from the endpoint as a list."""
@@ -14,18 +14,48 @@ import io
 import logging
 import re
 from abc import ABC, abstractmethod
+from itertools import chain, islice
 from os.path import basename
 
 import html5lib
 
+try:
+    from html5_parser import parse as html5_parse
+except (ImportError, RuntimeError):
+    # html5-parser raises RuntimeError if its libxml2 does not match lxml
+    html5_parse = None
+
 from . import blocks, schema, types
-from .text import Annotations, TextObject, lstrip, rstrip, truncate
+from .text import (
+    MAX_TEXT_OBJECT_SIZE,
+    Annotations,
+    TextObject,
+    lstrip,
+    rstrip,
+    truncate,
+)
 
 logger = logging.getLogger(__name__)
 
 # parse embedded image data
 img_data_re = re.compile("^data:image/([^;]+);([^,]+),(.+)$")
 
+# contiguous whitespace in text
+whitespace_re = re.compile(r"\s+")
+
+# documents with a single paragraph of text (no markup or character references);
+# input must be stripped of surrounding whitespace before matching
+simple_html_re = re.compile(r"^(?:<p>([^<&\x00]*)</p>|([^<&\x00]*))$")
+
+# the largest document that will be checked against `simple_html_re`
+MAX_SIMPLE_HTML_SIZE = 2048
+
+# numeric values in CSV data
+number_re = re.compile(r"^-?(0|[1-9]\d*)(\.\d+)?$")
+
+# the most significant digits that survive conversion to a float
+MAX_NUMBER_DIGITS = 15
+
 
 def condense_text(text):
     """Collapse contiguous whitespace from the given text."""
@@ -33,7 +63,12 @@ def condense_text(text):
     if text is None:
         return None
 
-    return re.sub(r"\s+", " ", text, flags=re.MULTILINE)
+    # most text has nothing to collapse; `isprintable()` rejects any whitespace other
+    # than the ASCII space, so only runs of spaces remain to be checked
+    if text.isprintable() and "  " not in text:
+        return text
+
+    return whitespace_re.sub(" ", text)
 
 
 def normalize_text(text):
@@ -49,10 +84,50 @@ def normalize_text(text):
 
 def gather_text(elem):
     """Return all text from the element and children."""
-    text = "".join(elem.itertext())
+
+    # elements without children (such as `<title>`) do not need to be traversed
+    if len(elem) == 0:
+        text = elem.text or ""
+    else:
+        text = "".join(elem.itertext())
+
     return normalize_text(text)
 
 
+def is_number(text):
+    """Determine if the given text can be stored as a `Number` without losing data.
+
+    Values with leading zeros (such as postal codes) or too many significant digits
+    (such as long identifiers) are not considered numbers.
+    """
+
+    if number_re.match(text) is None:
+        return False
+
+    digits = text.lstrip("-").replace(".", "").lstrip("0")
+
+    return len(digits) <= MAX_NUMBER_DIGITS
+
+
+def number_value(text):
+    """Convert the given text to a `Number` property value.
+
+    Values that would not survive the conversion (see `is_number()`) are rejected.
+    """
+
+    text = text.strip()
+
+    if not text:
+        return types.Number[None]
+
+    if not is_number(text):
+        raise ValueError(f"Invalid CSV: expected a number, not '{text}'")
+
+    value = float(text) if "." in text else int(text)
+
+    return types.Number[value]
+
+
 def strip_text_block(block):
     """Remove leading and trailing whitespace from text in the given block."""
 
@@ -146,20 +221,24 @@ class CsvParser(DocumentParser):
 
     schema: dict
 
-    def __init__(self, header_row=True, title_column=0):
+    def __init__(self, header_row=True, title_column=0, sample_size=0):
         """Initialize a new `CsvParser`.
 
         :param header_row: indicates that data will have a header row (for the schema)
         :param title_column: set the column in data to use for page titles
+        :param sample_size: the number of rows used to detect numeric columns (the
+            default of `0` treats all columns as text)
         """
         super().__init__()
 
         self._has_header = header_row
         self._title_index = title_column
+        self._sample_size = sample_size
 
         self.schema = {}
 
         self._field_names = []
+        self._field_ctors = []
 
     def parse(self, data):
         """Parse the given CSV data.
@@ -169,14 +248,42 @@ class CsvParser(DocumentParser):
             `title`: the name of the CSV file being parsed (if available)
             `content`: a list of page properties with the tabular data
         """
+        self.content.extend(self.iter_records(data))
+
+    def iter_records(self, data):
+        """Parse the given CSV data, yielding page properties for each entry.
+
+        Records are not kept in `content`, so memory use does not grow with the size
+        of the data.  This is the preferred method for large files.
+
+        The `schema` and `title` properties are available once the first record has
+        been returned.
+        """
         super().parse(data)
 
         if isinstance(data, str):
             data = io.StringIO(data, newline="")
 
+        # binary streams are decoded using a (buffered) text wrapper; the wrapper is
+        # detached afterwards so the caller's stream is not closed along with it
+        elif isinstance(data, (io.RawIOBase, io.BufferedIOBase)):
+            raw = isinstance(data, io.RawIOBase)
+            buffer = io.BufferedReader(data) if raw else data
+            text = io.TextIOWrapper(buffer, encoding="utf-8-sig", newline="")
+
+            try:
+                yield from self._process(csv.reader(text))
+            finally:
+                text.detach()
+
+                if raw:
+                    buffer.detach()
+
+            return
+
         reader = csv.reader(data)
 
-        self._process(reader)
+        yield from self._process(reader)
 
     def _process(self, reader):
         # build the schema based on the first row
@@ -188,57 +295,68 @@ class CsvParser(DocumentParser):
 
         if self._has_header:
             self._build_schema(*header)
+            sample = []
 
         else:
             cols = [str(num) for num in range(len(header))]
             self._build_schema(*cols)
-            self._build_record(*header)
+            sample = [header]
+
+        # the sample holds `sample_size` data rows, including a leading data row
+        if self._sample_size > 0:
+            sample.extend(islice(reader, self._sample_size - len(sample)))
+            self._infer_types(sample)
 
-        # process remaining entries
+        # process all entries, starting with the sample
 
-        for entry in reader:
-            self._build_record(*entry)
+        for entry in chain(sample, reader):
+            yield self._build_record(entry)
 
     def _build_schema(self, *fields):
         if fields is None or len(fields) < 1:
             raise ValueError("Invalid CSV: empty header")
 
-        column = 0
-
-        for field in fields:
+        for column, field in enumerate(fields):
             field = field.strip()
 
-            while field in self._field_names:
+            # the schema is keyed by field name, so it doubles as a fast lookup
+            while field in self.schema:
                 field = f"{field}_{column}"
 
             if column == self._title_index:
                 self.schema[field] = schema.Title()
+                self._field_ctors.append(types.Title.__compose__)
             else:
                 self.schema[field] = schema.RichText()
+                self._field_ctors.append(types.RichText.__compose__)
 
             self._field_names.append(field)
 
-            column += 1
-
-    def _build_record(self, *fields):
+    def _build_record(self, fields):
         if len(fields) != len(self._field_names):
             raise ValueError("Invalid CSV: incorrect number of fields in data")
 
-        record = {}
+        return {
+            name: ctor(value)
+            for name, ctor, value in zip(self._field_names, self._field_ctors, fields)
+        }
 
-        column = 0
+    def _infer_types(self, rows):
+        """Update the schema for columns where all sampled values are numbers.
 
-        for col in self._field_names:
-            value = fields[column]
+        Empty values are ignored; a column with no values in the sample remains text.
+        """
 
+        for column, field in enumerate(self._field_names):
             if column == self._title_index:
-                record[col] = types.Title[value]
-            else:
-                record[col] = types.RichText[value]
+                continue
 
-            column += 1
+            values = [row[column].strip() for row in rows if column < len(row)]
+            values = [value for value in values if value]
 
-        self.content.append(record)
+            if values and all(is_number(value) for value in values):
+                self.schema[field] = schema.Number()
+                self._field_ctors[column] = number_value
 
 
 class HtmlParser(DocumentParser):
@@ -260,6 +378,20 @@ class HtmlParser(DocumentParser):
         self._current_href = None
         self._current_text_style = Annotations()
 
+        # the most recent text object and the href / style it was created with
+        self._last_text = None
+        self._last_text_key = None
+
+        # pending work for the renderer; see `_render()`
+        self._stack = []
+
+        # map tag names to their render method once, rather than for every element
+        self._handlers = {
+            name[len("_render_") :]: getattr(self, name)
+            for name in dir(self)
+            if name.startswith("_render_")
+        }
+
     def parse(self, data):
         """Parse the given HTML data.
 
@@ -270,7 +402,22 @@ class HtmlParser(DocumentParser):
         """
         super().parse(data)
 
-        doc = html5lib.parse(data, namespaceHTMLElements=False)
+        # small snippets do not need a full parse
+        if isinstance(data, str) and len(data) < MAX_SIMPLE_HTML_SIZE:
+            m = simple_html_re.match(data.strip())
+
+            if m is not None:
+                self._process_simple(*m.groups())
+                return
+
+        if html5_parse is None:
+            doc = html5lib.parse(data, namespaceHTMLElements=False)
+
+        else:
+            if hasattr(data, "read"):
+                data = data.read()
+
+            doc = html5_parse(data, treebuilder="lxml", namespace_elements=False)
 
         self._render(doc)
 
@@ -280,30 +427,61 @@ class HtmlParser(DocumentParser):
         This method will look for an appropriate `render_*` method to handle the given
         tag name.  If there is not an available method, the element will be ignored.
 
+        Rather than recursing through the document, handlers push work onto a stack
+        which is processed here in a loop.  Work that must happen after an element's
+        contents are rendered (such as appending the finished block to its parent)
+        is pushed with `_defer()` *before* the contents are scheduled.
+
         :param elem: the ElementTree object to render
         :param parent: the parent block for the rendered content or `None`
         """
-        logger.debug("rendering element - %s :: %s", elem.tag, type(parent))
 
         if parent is None:
             parent = self.content
 
-        if hasattr(self, f"_render_{elem.tag}"):
-            logger.debug("handler func -- _render_%s", elem.tag)
-            pfunc = getattr(self, f"_render_{elem.tag}")
-            pfunc(elem, parent)
+        stack = self._stack
+        depth = len(stack)
+
+        self._schedule(elem, parent)
+
+        # discard any remaining work if a handler fails, so the parser is left clean
+        try:
+            while len(stack) > depth:
+                func, args = stack.pop()
+                func(*args)
+        finally:
+            del stack[depth:]
+
+    def _schedule(self, elem, parent):
+        """Push the given element onto the work stack, if it has a handler."""
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("rendering element - %s :: %s", elem.tag, type(parent))
+
+        # comments and processing instructions use a callable as the tag, which
+        # will never match a handler name
+        handler = self._handlers.get(elem.tag)
+
+        if handler is not None:
+            self._stack.append((handler, (elem, parent)))
 
-        logger.debug("block complete; %d total block(s)", len(self.content))
+    def _defer(self, func, *args):
+        """Push a function onto the work stack.
+
+        Since the stack is processed last-in-first-out, the function will be called
+        after any work that is scheduled following this call.
+        """
+        self._stack.append((func, args))
 
     def _render_a(self, elem, parent):
         self._current_href = elem.get("href")
+        self._defer(setattr, self, "_current_href", None)
         self._process_contents(elem, parent=parent)
-        self._current_href = None
 
     def _render_b(self, elem, parent):
         self._current_text_style.bold = True
+        self._defer(setattr, self._current_text_style, "bold", False)
         self._process_contents(elem, parent=parent)
-        self._current_text_style.bold = False
 
     def _render_base(self, elem, parent):
         base = elem.get("href")
@@ -312,8 +490,8 @@ class HtmlParser(DocumentParser):
 
     def _render_blockquote(self, elem, parent):
         block = blocks.Quote()
+        self._defer(parent.append, block)
         self._process_contents(elem, parent=block)
-        parent.append(block)
 
     def _render_body(self, elem, parent):
         self._process_contents(elem, parent=parent)
@@ -324,24 +502,24 @@ class HtmlParser(DocumentParser):
 
     def _render_code(self, elem, parent):
         self._current_text_style.code = True
+        self._defer(setattr, self._current_text_style, "code", False)
         self._process_contents(elem, parent=parent)
-        self._current_text_style.code = False
 
     def _render_dd(self, elem, parent):
         self._process_contents(elem, parent=parent)
 
     def _render_del(self, elem, parent):
         self._current_text_style.strikethrough = True
+        self._defer(setattr, self._current_text_style, "strikethrough", False)
         self._process_contents(elem, parent=parent)
-        self._current_text_style.strikethrough = False
 
     def _render_div(self, elem, parent):
         self._process_contents(elem, parent)
 
     def _render_dl(self, elem, parent):
         dl = blocks.Paragraph()
+        self._defer(parent.append, dl)
         self._process_contents(elem, parent=dl)
-        parent.append(dl)
 
     def _render_dt(self, elem, parent):
         self._process_contents(elem, parent=parent)
@@ -351,18 +529,18 @@ class HtmlParser(DocumentParser):
 
     def _render_h1(self, elem, parent):
         h1 = blocks.Heading1()
+        self._defer(parent.append, h1)
         self._process_contents(elem, parent=h1)
-        parent.append(h1)
 
     def _render_h2(self, elem, parent):
         h2 = blocks.Heading2()
+        self._defer(parent.append, h2)
         self._process_contents(elem, parent=h2)
-        parent.append(h2)
 
     def _render_h3(self, elem, parent):
         h3 = blocks.Heading3()
+        self._defer(parent.append, h3)
         self._process_contents(elem, parent=h3)
-        parent.append(h3)
 
     def _render_h4(self, elem, parent):
         self._render_h3(elem, parent)
@@ -387,8 +565,8 @@ class HtmlParser(DocumentParser):
 
     def _render_i(self, elem, parent):
         self._current_text_style.italic = True
+        self._defer(setattr, self._current_text_style, "italic", False)
         self._process_contents(elem, parent=parent)
-        self._current_text_style.italic = False
 
     def _render_iframe(self, elem, parent):
         src = elem.get("src")
@@ -435,13 +613,13 @@ class HtmlParser(DocumentParser):
 
     def _render_p(self, elem, parent):
         para = blocks.Paragraph()
+        self._defer(parent.append, para)
         self._process_contents(elem, parent=para)
-        parent.append(para)
 
     def _render_pre(self, elem, parent):
         block = blocks.Code()
+        self._defer(parent.append, block)
         self._process_contents(elem, parent=block)
-        parent.append(block)
 
     def _render_s(self, elem, parent):
         self._render_del(elem, parent)
@@ -460,10 +638,13 @@ class HtmlParser(DocumentParser):
 
     def _render_table(self, elem, parent):
         table = blocks.Table()
-        self._process_contents(elem, parent=table)
 
-        if table.Width > 0:
-            parent.append(table)
+        def append_table():
+            if table.Width > 0:
+                parent.append(table)
+
+        self._defer(append_table)
+        self._process_contents(elem, parent=table)
 
     def _render_tbody(self, elem, parent):
         self._process_contents(elem, parent)
@@ -498,18 +679,19 @@ class HtmlParser(DocumentParser):
             raise TypeError("Invalid parent for <tr>")
 
         row = blocks.TableRow()
-        for td in elem.findall("td"):
-            self._render(td, parent=row)
+        self._defer(parent.append, row)
 
-        parent.append(row)
+        for td in reversed(elem):
+            if td.tag == "td":
+                self._schedule(td, parent=row)
 
     def _render_tt(self, elem, parent):
         self._render_pre(elem, parent=parent)
 
     def _render_u(self, elem, parent):
         self._current_text_style.underline = True
+        self._defer(setattr, self._current_text_style, "underline", False)
         self._process_contents(elem, parent=parent)
-        self._current_text_style.underline = False
 
     def _render_ul(self, elem, parent):
         self._process_list(elem, parent, blocks.BulletedListItem)
@@ -524,26 +706,81 @@ class HtmlParser(DocumentParser):
 
         When appropriate, whitespace in the text will be removed.
         """
-        logger.debug("appending text :: %s => '%s'", parent.type, truncate(text, 10))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "appending text :: %s => '%s'", parent.type, truncate(text, 10)
+            )
 
         if not isinstance(parent, blocks.Code):
             text = condense_text(text)
 
-        obj = TextObject[text, self._current_href, self._current_text_style]
-
         if isinstance(parent, blocks.TextBlock):
-            if obj is not None:
-                parent.concat(obj)
+            if text is None:
+                return
+
+            rtf = parent.__text__
+
+            # leading whitespace would be stripped from the block anyway
+            if not rtf and text.isspace() and not isinstance(parent, blocks.Code):
+                return
+
+            text_key = (self._current_href, *vars(self._current_text_style).values())
+
+            # extend the previous text object if it has the same link and style
+            last = self._last_text
+
+            if (
+                rtf
+                and rtf[-1] is last
+                and text_key == self._last_text_key
+                and len(last.plain_text) + len(text) <= MAX_TEXT_OBJECT_SIZE
+            ):
+                last.plain_text += text
+                last.text.content = last.plain_text
+                return
+
+            obj = TextObject[text, self._current_href, self._current_text_style]
+            parent.concat(obj)
+
+            self._last_text = obj
+            self._last_text_key = text_key
 
         elif isinstance(parent, blocks.TableRow):
+            obj = TextObject[text, self._current_href, self._current_text_style]
             parent.append(obj)
 
+    def _process_simple(self, para_text, plain_text):
+        """Render a document that contains a single paragraph of text.
+
+        This produces the same content as a full parse of the document.
+
+        :param para_text: the contents of a lone `<p>` element (or `None`)
+        :param plain_text: the document text if it has no markup (or `None`)
+        """
+
+        if para_text is not None:
+            para = blocks.Paragraph()
+
+            if para_text and not para_text.isspace():
+                self._append_text(para_text, para)
+
+        elif plain_text and not plain_text.isspace():
+            para = blocks.Paragraph()
+            self._append_text(plain_text, para)
+
+        else:
+            return
+
+        strip_text_block(para)
+        self.content.append(para)
+
     def _process_contents(self, elem, parent):
         """Process the contents of the given element as children of `parent`.
 
         This will process all children of the element, including text and nodes.
         """
-        logger.debug("processing contents :: %s %s", elem.tag, type(parent))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("processing contents :: %s %s", elem.tag, type(parent))
 
         # empty elements don't need text processing...
         if not elem_has_text(elem, with_children=False):
@@ -564,17 +801,25 @@ class HtmlParser(DocumentParser):
             parent.append(new_parent)
             parent = new_parent
 
+        if isinstance(parent, blocks.TextBlock):
+            self._defer(strip_text_block, parent)
+
+        # children are pushed in reverse so they are rendered in document order
+        schedule = self._schedule
+
         if has_text:
             self._append_text(elem.text, parent)
 
-        for child in elem:
-            self._render(child, parent)
+            stack = self._stack
+            append_text = self._append_text
 
-            if has_text:
-                self._append_text(child.tail, parent)
+            for child in reversed(elem):
+                stack.append((append_text, (child.tail, parent)))
+                schedule(child, parent)
 
-        if isinstance(parent, blocks.TextBlock):
-            strip_text_block(parent)
+        else:
+            for child in reversed(elem):
+                schedule(child, parent)
 
     def _process_list(self, elem, parent, kind):
         """Process contents of the given element as a list.
@@ -585,13 +830,19 @@ class HtmlParser(DocumentParser):
         """
         list_parent = parent
 
+        # collect work in document order, then push it in reverse onto the stack
+        stack = self._stack
+        depth = len(stack)
+
         for child in elem:
             if child.tag == "li":
                 list_parent = kind()
-                self._render(child, parent=list_parent)
-                parent.append(list_parent)
+                self._schedule(child, parent=list_parent)
+                self._defer(parent.append, list_parent)
             else:
-                self._render(child, list_parent)
+                self._schedule(child, list_parent)
+
+        stack[depth:] = reversed(stack[depth:])
 
     def _process_img_data(self, elem):
         import base64
@@ -607,16 +858,13 @@ class HtmlParser(DocumentParser):
         if m is None:
             raise ValueError("Image data missing")
 
-        img_type = m.groups()[0]
-        img_data_enc = m.groups()[1]
-        img_data_str = m.groups()[2]
+        img_type, img_data_enc, img_data_str = m.groups()
 
         logger.debug("decoding embedded image: %s [%s]", img_type, img_data_enc)
 
         if img_data_enc == "base64":
             logger.debug("decoding base64 image: %d bytes", len(img_data_str))
-            img_data_b64 = img_data_str.encode("ascii")
-            img_data = base64.b64decode(img_data_b64)
+            img_data = base64.b64decode(img_data_str)
         else:
             raise ValueError(f"Unsupported img encoding: {img_data_enc}")
 
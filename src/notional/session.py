@@ -1,7 +1,6 @@
 """Provides direct access to the Notion API."""
 
 import logging
-from inspect import isclass
 from typing import Dict, Union
 
 import notion_client
@@ -346,7 +345,7 @@ class DatabasesEndpoint(Endpoint):
         :param target: either a `DatabaseRef` type or an ORM class
         """
 
-        if isclass(target) and issubclass(target, ConnectedPage):
+        if isinstance(target, type) and issubclass(target, ConnectedPage):
             cls = target
             dbid = target._notional__database
 
@@ -1,7 +1,7 @@
 """Utilities for working text, markdown & Rich Text in Notion."""
 
 import re
-from copy import deepcopy
+from copy import copy
 from enum import Enum
 from typing import Optional
 
@@ -197,6 +197,21 @@ class Annotations(GenericObject):
     code: bool = False
     color: FullColor = None
 
+    def __copy__(self):
+        """Return a copy of this `Annotations` object.
+
+        All fields hold immutable values, so copying the field values directly is
+        sufficient and skips the generic field iteration of `BaseModel.copy()`.
+        """
+
+        cls = self.__class__
+        obj = cls.__new__(cls)
+
+        object.__setattr__(obj, "__dict__", self.__dict__.copy())
+        object.__setattr__(obj, "__fields_set__", self.__fields_set__.copy())
+
+        return obj
+
     @property
     def is_plain(self):
         """Determine if any flags are set in this `Annotations` object.
@@ -266,7 +281,7 @@ class RichTextObject(TypedObject):
 
         # TODO convert markdown in text:str to RichText?
 
-        style = deepcopy(style)
+        style = copy(style)
 
         return cls(plain_text=text, href=href, annotations=style)
 
@@ -296,7 +311,7 @@ class TextObject(RichTextObject, type="text"):
 
         link = LinkObject(url=href) if href else None
         nested = TextObject._NestedData(content=text, link=link)
-        style = deepcopy(style)
+        style = copy(style)
 
         return cls(
             plain_text=text,
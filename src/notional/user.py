@@ -29,14 +29,9 @@ class User(NotionObject, object="user"):
         if obj is None:
             return None
 
-        if "type" in obj:
-            if obj["type"] == "person":
-                return Person(**obj)
+        user_class = USER_TYPES.get(obj.get("type"), cls)
 
-            if obj["type"] == "bot":
-                return Bot(**obj)
-
-        return cls(obj)
+        return user_class(**obj)
 
 
 class Person(User):
@@ -63,3 +58,10 @@ class Bot(User):
     def __str__(self):
         """Return a string representation of this `Bot`."""
         return f"[%{self.name}]"
+
+
+# map user types from the API to their classes (used by `User.parse_obj()`)
+USER_TYPES = {
+    UserType.PERSON: Person,
+    UserType.BOT: Bot,
+}
@@ -1,5 +1,9 @@
 """Unit tests for the Notional parsers."""
 
+import io
+
+import pytest
+
 from notional import schema, types
 from notional.parser import CsvParser
 
@@ -29,3 +33,200 @@ def test_basic_csv_data_check():
     assert "last" in entry
     assert isinstance(entry["last"], types.RichText)
     assert entry["last"].Value == "two"
+
+
+def test_csv_without_header():
+    """Confirm parsing CSV data without a header row."""
+
+    data = """one,two\nthree,four"""
+
+    parser = CsvParser(header_row=False)
+    parser.parse(data)
+
+    assert list(parser.schema) == ["0", "1"]
+    assert len(parser.content) == 2
+
+    entry = parser.content[1]
+
+    assert entry["0"].Value == "three"
+    assert entry["1"].Value == "four"
+
+
+def test_csv_incorrect_field_count():
+    """Confirm rows with the wrong number of fields are rejected."""
+
+    data = """first,last\none,two,three"""
+
+    parser = CsvParser(header_row=True)
+
+    with pytest.raises(ValueError):
+        parser.parse(data)
+
+
+def test_csv_number_columns():
+    """Confirm numeric columns are detected from the sampled data."""
+
+    data = """name,count,price,note\none,1,1.5,a\ntwo,,-2.25,3\nthree,42,7,c"""
+
+    parser = CsvParser(header_row=True, sample_size=100)
+    parser.parse(data)
+
+    assert isinstance(parser.schema["name"], schema.Title)
+    assert isinstance(parser.schema["count"], schema.Number)
+    assert isinstance(parser.schema["price"], schema.Number)
+    assert isinstance(parser.schema["note"], schema.RichText)
+
+    entry = parser.content[1]
+
+    assert isinstance(entry["count"], types.Number)
+    assert entry["count"].Value is None
+    assert entry["price"].Value == -2.25
+
+    assert parser.content[2]["count"].Value == 42
+
+
+def test_csv_number_outside_sample():
+    """Confirm non-numeric data after the sample is rejected."""
+
+    data = """name,count\none,1\ntwo,many"""
+
+    parser = CsvParser(header_row=True, sample_size=1)
+
+    with pytest.raises(ValueError):
+        parser.parse(data)
+
+
+def test_csv_without_sample():
+    """Confirm all columns are text by default."""
+
+    data = """name,count\none,1"""
+
+    parser = CsvParser(header_row=True)
+    parser.parse(data)
+
+    assert isinstance(parser.schema["count"], schema.RichText)
+    assert parser.content[0]["count"].Value == "1"
+
+
+def test_csv_duplicate_columns():
+    """Confirm duplicate column names are made unique."""
+
+    data = """name,value,value\none,a,b"""
+
+    parser = CsvParser(header_row=True)
+    parser.parse(data)
+
+    assert list(parser.schema) == ["name", "value", "value_2"]
+    assert parser.content[0]["value_2"].Value == "b"
+
+
+def test_csv_binary_data():
+    """Confirm parsing CSV data from a binary stream."""
+
+    data = io.BytesIO("first,last\nüno,two\n".encode("utf-8-sig"))
+
+    parser = CsvParser(header_row=True)
+    parser.parse(data)
+
+    assert "first" in parser.schema
+    assert parser.content[0]["first"].Value == "üno"
+
+    assert not data.closed
+
+
+def test_csv_iter_records():
+    """Confirm records can be read without storing them in the parser."""
+
+    data = """first,last\none,two\nthree,four"""
+
+    parser = CsvParser(header_row=True)
+    records = parser.iter_records(data)
+
+    entry = next(records)
+
+    assert isinstance(parser.schema["first"], schema.Title)
+    assert entry["first"].Value == "one"
+
+    entry = next(records)
+    assert entry["last"].Value == "four"
+
+    with pytest.raises(StopIteration):
+        next(records)
+
+    assert len(parser.content) == 0
+
+
+def test_csv_leading_zeros():
+    """Confirm values with leading zeros are kept as text."""
+
+    data = """name,zip\none,02134\ntwo,10001"""
+
+    parser = CsvParser(header_row=True, sample_size=100)
+    parser.parse(data)
+
+    assert isinstance(parser.schema["zip"], schema.RichText)
+    assert parser.content[0]["zip"].Value == "02134"
+
+
+def test_csv_long_identifiers():
+    """Confirm values with too many significant digits are kept as text."""
+
+    data = """name,id,small\none,12345678901234567890,0.000123"""
+
+    parser = CsvParser(header_row=True, sample_size=100)
+    parser.parse(data)
+
+    assert isinstance(parser.schema["id"], schema.RichText)
+    assert parser.content[0]["id"].Value == "12345678901234567890"
+
+    assert isinstance(parser.schema["small"], schema.Number)
+
+
+def test_csv_without_header_as_text():
+    """Confirm headerless data is parsed as text with the default settings."""
+
+    data = """a,1\nb,x"""
+
+    parser = CsvParser(header_row=False)
+    parser.parse(data)
+
+    assert isinstance(parser.schema["1"], schema.RichText)
+    assert parser.content[0]["1"].Value == "1"
+    assert parser.content[1]["1"].Value == "x"
+
+
+def test_csv_without_header_sample_size():
+    """Confirm the sample for headerless data includes the first row."""
+
+    data = """a,1\nb,x"""
+
+    parser = CsvParser(header_row=False, sample_size=1)
+
+    with pytest.raises(ValueError):
+        parser.parse(data)
+
+
+def test_csv_leading_zeros_outside_sample():
+    """Confirm lossy numbers after the sample are rejected."""
+
+    for value in ["02134", "1_000", "nan", "inf", "1e3", "12345678901234567890"]:
+        data = f"name,zip\none,10001\ntwo,{value}"
+
+        parser = CsvParser(header_row=True, sample_size=1)
+
+        with pytest.raises(ValueError):
+            parser.parse(data)
+
+
+def test_csv_unbuffered_binary_data(tmp_path):
+    """Confirm parsing CSV data from an unbuffered binary stream."""
+
+    path = tmp_path / "data.csv"
+    path.write_bytes(b"first,last\none,two\n")
+
+    with open(path, "rb", buffering=0) as fp:
+        parser = CsvParser(header_row=True)
+        parser.parse(fp)
+
+        assert parser.content[0]["last"].Value == "two"
+        assert not fp.closed
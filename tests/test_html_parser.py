@@ -4,8 +4,9 @@ import os
 
 import pytest
 
+import notional.parser
 from notional import blocks
-from notional.parser import HtmlParser
+from notional.parser import HtmlParser, condense_text
 from notional.text import plain_text
 
 BASEDIR = os.path.dirname(os.path.abspath(__file__))
@@ -95,6 +96,19 @@ def check_style(text, **expected_style):
         assert current_value == expected_value
 
 
+@pytest.fixture(autouse=True, params=["html5-parser", "html5lib"])
+def html_backend(request, monkeypatch):
+    """Run each test with both the optional `html5-parser` and `html5lib`."""
+
+    if request.param == "html5lib":
+        monkeypatch.setattr(notional.parser, "html5_parse", None)
+
+    elif notional.parser.html5_parse is None:
+        pytest.skip("html5-parser is not installed")
+
+    return request.param
+
+
 @pytest.fixture
 def dormouse():
     """Parse the `dormouse.html` test data as a test fixture."""
@@ -209,6 +223,52 @@ def test_naked_text():
     )
 
 
+def test_condense_text():
+    """Confirm all forms of contiguous whitespace are collapsed."""
+
+    assert condense_text(None) is None
+    assert condense_text("") == ""
+    assert condense_text("plain text") == "plain text"
+    assert condense_text("two  spaces") == "two spaces"
+    assert condense_text("tab\tnewline\r\n") == "tab newline "
+    assert condense_text("non\xa0breaking") == "non breaking"
+
+
+def test_naked_text_with_entity():
+    """Confirm character references are decoded in plain text."""
+
+    check_single_block(
+        html="Salt &amp; Pepper",
+        expected_type=blocks.Paragraph,
+        expected_text="Salt & Pepper",
+    )
+
+
+def test_empty_paragraph():
+    """Confirm support for `<p>` tags without text."""
+
+    block = check_single_block(
+        html=" <p> </p> ",
+        expected_type=blocks.Paragraph,
+    )
+
+    assert len(block("rich_text")) == 0
+
+
+def test_leading_whitespace_before_markup():
+    """Confirm a long whitespace prefix does not slow down simple document checks."""
+
+    # this stays under the size limit for simple documents, so it is checked against
+    # the simple pattern before falling back to a full parse
+    html = "\n" * 2000 + "<div>Spaced Out</div>"
+
+    check_single_block(
+        html=html,
+        expected_type=blocks.Paragraph,
+        expected_text="Spaced Out",
+    )
+
+
 def test_basic_quote():
     """Confirm support for `<blockquote>` elements."""
 
@@ -275,6 +335,19 @@ def test_incorrect_nested_list():
         assert isinstance(block, blocks.BulletedListItem)
 
 
+def test_deeply_nested_elements():
+    """Confirm that deeply nested documents do not exhaust the call stack."""
+
+    depth = 5000
+    html = "<div>" * depth + "Deep Text" + "</div>" * depth
+
+    check_single_block(
+        html=html,
+        expected_type=blocks.Paragraph,
+        expected_text="Deep Text",
+    )
+
+
 def test_implicit_text():
     """Confirm support for text outside of phrasing elements."""
 
@@ -308,6 +381,38 @@ def test_strong_text():
     check_style(text[0], bold=True)
 
 
+def test_merged_text():
+    """Confirm adjacent text with the same style is kept in one text object."""
+
+    block = check_single_block(
+        html="<p>One <span>Two</span> <b>Three</b> Four</p>",
+        expected_type=blocks.Paragraph,
+        expected_text="One Two Three Four",
+    )
+
+    text = block("rich_text")
+
+    assert len(text) == 3
+    check_style(text[0], bold=False)
+    check_style(text[1], bold=True)
+    check_style(text[2], bold=False)
+
+
+def test_leading_whitespace():
+    """Confirm leading whitespace does not leave empty text objects."""
+
+    block = check_single_block(
+        html="<p>\n  <b>Bold</b> Text</p>",
+        expected_type=blocks.Paragraph,
+        expected_text="Bold Text",
+    )
+
+    text = block("rich_text")
+
+    assert len(text) == 2
+    check_style(text[0], bold=True)
+
+
 def test_emphasis_text():
     """Confirm support for emphasized/italic text."""
 
@@ -341,6 +446,19 @@ def test_empty_table_cells():
     )
 
 
+def test_mismatched_table_rows():
+    """Confirm a failed parse does not leave pending work in the parser."""
+
+    html = "<table><tr><td>A</td><td>B</td></tr><tr><td>C</td></tr></table>"
+
+    parser = HtmlParser()
+
+    with pytest.raises(ValueError):
+        parser.parse(html)
+
+    assert len(parser._stack) == 0
+
+
 def test_table_cell_with_div():
     """Confirm support for table cells with `<div>` elements."""
 
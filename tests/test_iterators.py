@@ -1 +1,88 @@
 """Unit tests for the Notional iterators."""
+
+import threading
+from uuid import uuid4
+
+from notional.iterator import EndpointIterator
+from notional.user import User
+
+
+class PagedEndpoint:
+    """A fake API endpoint that returns a fixed number of user pages."""
+
+    def __init__(self, pages, page_size):
+        """Initialize the endpoint with `pages` pages of `page_size` users each."""
+        self.pages = pages
+        self.page_size = page_size
+        self.calls = []
+
+    def __call__(self, start_cursor=None, **kwargs):
+        """Return the page of results for the given cursor."""
+        page_num = 0 if start_cursor is None else int(start_cursor)
+        self.calls.append((page_num, threading.current_thread()))
+
+        has_more = page_num + 1 < self.pages
+
+        return {
+            "object": "list",
+            "type": "user",
+            "user": {},
+            "results": [
+                {"object": "user", "id": str(uuid4()), "name": f"{page_num}.{idx}"}
+                for idx in range(self.page_size)
+            ],
+            "has_more": has_more,
+            "next_cursor": str(page_num + 1) if has_more else None,
+        }
+
+
+def test_iterate_all_pages():
+    """Confirm all results are returned in order across pages."""
+    endpoint = PagedEndpoint(pages=3, page_size=2)
+    iterator = EndpointIterator(endpoint)
+
+    names = [user.name for user in iterator()]
+
+    assert names == ["0.0", "0.1", "1.0", "1.1", "2.0", "2.1"]
+    assert [page for page, _ in endpoint.calls] == [0, 1, 2]
+
+    assert iterator.page_num == 3
+    assert iterator.total_items == 6
+    assert iterator.has_more is False
+
+
+def test_prefetch_next_page():
+    """Confirm the next page is requested in the background."""
+    endpoint = PagedEndpoint(pages=2, page_size=2)
+
+    users = EndpointIterator(endpoint, prefetch=True).list()
+
+    assert len(users) == 4
+    assert isinstance(users[0], User)
+
+    main_thread = threading.current_thread()
+
+    assert endpoint.calls[0][1] is main_thread
+    assert endpoint.calls[1][1] is not main_thread
+
+
+def test_first_item_only():
+    """Confirm that reading one item does not request additional pages."""
+    endpoint = PagedEndpoint(pages=2, page_size=2)
+
+    first = next(EndpointIterator(endpoint, prefetch=True)())
+
+    assert first.name == "0.0"
+    assert len(endpoint.calls) == 1
+
+
+def test_without_prefetch():
+    """Confirm pages are requested in the caller's thread by default."""
+    endpoint = PagedEndpoint(pages=2, page_size=2)
+
+    users = EndpointIterator(endpoint).list()
+
+    assert len(users) == 4
+
+    main_thread = threading.current_thread()
+    assert all(thread is main_thread for _, thread in endpoint.calls)
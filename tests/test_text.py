@@ -65,6 +65,17 @@ def test_bold_text():
     assert markdown(text) == "**be BOLD**"
 
 
+def test_style_is_copied():
+    """Verify that changes to a style do not affect previously composed text."""
+    style = Annotations(bold=True)
+    text = TextObject["be BOLD", None, style]
+
+    style.bold = False
+
+    assert text.annotations is not style
+    assert text.annotations.bold
+
+
 def test_emphasis_text():
     """Verify text formatting for italic words."""
     style = Annotations(italic=True)
@@ -42,6 +42,16 @@ def test_parse_bob():
     assert user.avatar_url is None
 
 
+def test_parse_untyped_user():
+    """Create a generic user from API data without a type."""
+    user = User.parse_obj(
+        {"object": "user", "id": "fb187a7b-547c-47b0-a575-8dc15b02138b"}
+    )
+
+    assert type(user) == User
+    assert user.type is None
+
+
 @pytest.mark.vcr()
 def test_user_list(notion):
     """Confirm that we can list some users."""